@@ -1 +1,16 @@
-from .table_tree import TableTree
+__all__ = ['TableTree']
+
+
+def __getattr__(name):
+    # Importing TableTree pulls in astropy.table; defer that until the
+    # name is actually used so that ``import msumastro`` stays cheap.
+    if name == 'TableTree':
+        from .table_tree import TableTree
+        globals()[name] = TableTree
+        return TableTree
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__,
+                                                                    name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
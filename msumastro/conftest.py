@@ -32,9 +32,11 @@ def triage_setup(request):
     original_dir = os.getcwd()
     os.chdir(test_dir)
     img = np.uint16(np.arange(100))
+    light = IRAF_image_type('light')
+    bias = IRAF_image_type('bias')
 
     no_filter_no_object = fits.PrimaryHDU(img)
-    no_filter_no_object.header['imagetyp'] = IRAF_image_type('light')
+    no_filter_no_object.header['imagetyp'] = light
     no_filter_no_object.writeto('no_filter_no_object_light.fit')
     n_test['files'] += 1
     n_test['need_object'] += 1
@@ -42,13 +44,13 @@ def triage_setup(request):
     n_test['light'] += 1
     n_test['need_pointing'] += 1
 
-    no_filter_no_object.header['imagetyp'] = IRAF_image_type('bias')
+    no_filter_no_object.header['imagetyp'] = bias
     no_filter_no_object.writeto('no_filter_no_object_bias.fit')
     n_test['files'] += 1
     n_test['bias'] += 1
 
     filter_no_object = fits.PrimaryHDU(img)
-    filter_no_object.header['imagetyp'] = IRAF_image_type('light')
+    filter_no_object.header['imagetyp'] = light
     filter_no_object.header['filter'] = 'R'
     filter_no_object.writeto('filter_no_object_light.fit')
     n_test['files'] += 1
@@ -56,13 +58,13 @@ def triage_setup(request):
     n_test['light'] += 1
     n_test['need_pointing'] += 1
 
-    filter_no_object.header['imagetyp'] = IRAF_image_type('bias')
+    filter_no_object.header['imagetyp'] = bias
     filter_no_object.writeto('filter_no_object_bias.fit')
     n_test['files'] += 1
     n_test['bias'] += 1
 
     filter_object = fits.PrimaryHDU(img)
-    filter_object.header['imagetyp'] = IRAF_image_type('light')
+    filter_object.header['imagetyp'] = light
     filter_object.header['filter'] = 'R'
     filter_object.header['OBJCTRA'] = '00:00:00'
     filter_object.header['OBJCTDEC'] = '00:00:00'
@@ -1,10 +1,12 @@
 import logging
 import subprocess
-from os import path, remove, rename
+from os import path, remove, rename, cpu_count
 import tempfile
 from textwrap import dedent
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-__all__ = ['call_astrometry', 'add_astrometry']
+__all__ = ['call_astrometry', 'add_astrometry', 'add_astrometry_many']
 
 logger = logging.getLogger(__name__)
 
@@ -65,94 +67,51 @@ def call_astrometry(filename, sextractor=False,
     timeout : int or None, optional
         Max time subprocess can run, in seconds. ``None`` means no timeout.
     """
-    solve_field = ["solve-field"]
-    option_list = []
+    solve_field = ["solve-field", "--obj", "100"]
+    solve_field.extend(_solve_field_options(sextractor,
+                                            feder_settings,
+                                            no_plots,
+                                            minimal_output,
+                                            save_wcs,
+                                            overwrite,
+                                            wcs_reference_image_center))
 
-    option_list.append("--obj 100")
-    if feder_settings:
-        option_list.append(
-            "--scale-low 0.5 --scale-high 0.6 --scale-units arcsecperpix")
+    if custom_sextractor_config:
+        solve_field.extend([
+            '--source-extractor-config', _write_sextractor_config(),
+            '--x-column', 'X_IMAGE',
+            '--y-column',  'Y_IMAGE',
+            '--sort-column', 'MAG_AUTO',
+            '--sort-ascending'
+        ])
 
     if additional_args is not None:
         if isinstance(additional_args, str):
             add_ons = [additional_args]
         else:
             add_ons = additional_args
-        option_list.extend(add_ons)
-
-    if isinstance(sextractor, str):
-        option_list.append("--source-extractor-path " + sextractor)
-    elif sextractor:
-        option_list.append("--use-source-extractor")
-
-    if no_plots:
-        option_list.append("--no-plot")
-
-    if minimal_output:
-        option_list.append("--corr none --rdls none --match none")
-        if not save_wcs:
-            option_list.append("--wcs none")
+        # Each additional argument may itself be several command line
+        # options, e.g. "--downsample 2".
+        for add_on in add_ons:
+            solve_field.extend(add_on.split())
 
     if ra_dec is not None:
-        option_list.append("--ra %s --dec %s --radius 0.5" % ra_dec)
-
-    if overwrite:
-        option_list.append("--overwrite")
-
-    if wcs_reference_image_center:
-        option_list.append("--crpix-center")
-
-    options = " ".join(option_list)
-
-    solve_field.extend(options.split())
-
-    if custom_sextractor_config:
-        tmp_location = tempfile.mkdtemp()
-        param_location = path.join(tmp_location, 'default.param')
-        config_location = path.join(tmp_location, 'feder.config')
-        config_contents = SExtractor_config.format(param_file=param_location)
-        with open(config_location, 'w') as f:
-            f.write(config_contents)
-        with open(param_location, 'w') as f:
-            contents = """
-                X_IMAGE
-                Y_IMAGE
-                MAG_AUTO
-                FLUX_AUTO
-            """
-
-            f.write(dedent(contents))
-
-        additional_solve_args = [
-            '--source-extractor-config', config_location,
-            '--x-column', 'X_IMAGE',
-            '--y-column',  'Y_IMAGE',
-            '--sort-column', 'MAG_AUTO',
-            '--sort-ascending'
-        ]
-
-        solve_field.extend(additional_solve_args)
+        solve_field.extend(["--ra", str(ra_dec[0]), "--dec", str(ra_dec[1]),
+                            "--radius", "0.5"])
 
     if odds_ratio is not None:
-        solve_field.append('--odds-to-solve')
-        solve_field.append(odds_ratio)
+        solve_field.extend(['--odds-to-solve', str(odds_ratio)])
 
     if astrometry_config is not None:
-        solve_field.append('--config')
-        solve_field.append(astrometry_config)
-
-    # kludge to handle case when path of verify file contains a space--split
-    # above does not work for that case.
+        solve_field.extend(['--config', astrometry_config])
 
     if verify is not None:
         if verify:
-            solve_field.append("--verify")
-            solve_field.append("%s" % verify)
+            solve_field.extend(["--verify", str(verify)])
         else:
             solve_field.append("--no-verify")
 
-    solve_field.extend([filename])
-    print(' '.join(solve_field))
+    solve_field.append(filename)
     logger.info(' '.join(solve_field))
     try:
         solve_field_output = subprocess.check_output(solve_field,
@@ -175,6 +134,83 @@ def call_astrometry(filename, sextractor=False,
     return return_status
 
 
+@lru_cache(maxsize=16)
+def _solve_field_options(sextractor, feder_settings, no_plots,
+                         minimal_output, save_wcs, overwrite,
+                         wcs_reference_image_center):
+    """
+    Construct the `solve-field` options which do not depend on the image.
+
+    The options are the same for every image solved with the same settings,
+    so they are built only once per combination of settings. Arguments are
+    as in :func:`call_astrometry`.
+
+    Returns
+    -------
+    tuple of str
+        Command line options for `solve-field`.
+    """
+    options = []
+
+    if feder_settings:
+        options.extend(["--scale-low", "0.5", "--scale-high", "0.6",
+                        "--scale-units", "arcsecperpix"])
+
+    if isinstance(sextractor, str):
+        options.extend(["--source-extractor-path", sextractor])
+    elif sextractor:
+        options.append("--use-source-extractor")
+
+    if no_plots:
+        options.append("--no-plot")
+
+    if minimal_output:
+        options.extend(["--corr", "none", "--rdls", "none",
+                        "--match", "none"])
+        if not save_wcs:
+            options.extend(["--wcs", "none"])
+
+    if overwrite:
+        options.append("--overwrite")
+
+    if wcs_reference_image_center:
+        options.append("--crpix-center")
+
+    return tuple(options)
+
+
+def _write_sextractor_config():
+    """
+    Write the SExtractor configuration customized for Feder images.
+
+    A fresh copy is written for each solve rather than reused, so that a
+    temporary directory removed while the program runs cannot leave
+    `solve-field` pointing at a missing file.
+
+    Returns
+    -------
+    str
+        Path to the configuration file.
+    """
+    tmp_location = tempfile.mkdtemp()
+    param_location = path.join(tmp_location, 'default.param')
+    config_location = path.join(tmp_location, 'feder.config')
+    config_contents = SExtractor_config.format(param_file=param_location)
+    with open(config_location, 'w') as f:
+        f.write(config_contents)
+    with open(param_location, 'w') as f:
+        contents = """
+            X_IMAGE
+            Y_IMAGE
+            MAG_AUTO
+            FLUX_AUTO
+        """
+
+        f.write(dedent(contents))
+
+    return config_location
+
+
 def add_astrometry(filename, overwrite=False, ra_dec=None,
                    note_failure=False, save_wcs=False,
                    verify=None, try_builtin_source_finder=False,
@@ -254,22 +290,21 @@ def add_astrometry(filename, overwrite=False, ra_dec=None,
     if camera:
         use_feder = False
         scale = camera_pixel_scales[camera]
-        scale_options = ("--scale-low {low} --scale-high {high} "
-                         "--scale-units arcsecperpix".format(low=0.8*scale, high=1.2 * scale))
+        scale_options = ["--scale-low", str(0.8 * scale),
+                         "--scale-high", str(1.2 * scale),
+                         "--scale-units", "arcsecperpix"]
     else:
         use_feder = True
-        scale_options = ''
+        scale_options = []
 
     if avoid_pyfits:
-        pyfits_options = '--no-remove-lines --uniformize 0'
+        pyfits_options = ['--no-remove-lines', '--uniformize', '0']
     else:
-        pyfits_options = ''
+        pyfits_options = []
 
-    additional_opts = ' '.join([scale_options,
-                                pyfits_options])
+    additional_opts = scale_options + pyfits_options
 
     if solve_field_args is not None:
-        additional_opts = additional_opts.split()
         additional_opts.extend(solve_field_args)
 
     logger.info('BEGIN ADDING ASTROMETRY on {0}'.format(filename))
@@ -349,6 +384,57 @@ def add_astrometry(filename, overwrite=False, ra_dec=None,
     return solved_field
 
 
+def add_astrometry_many(filenames, max_workers=None, **kwd):
+    """
+    Add WCS headers to several FITS files, solving them in parallel.
+
+    Parameters
+    ----------
+    filenames : list of str
+        Names of the files to which astrometry should be added.
+
+    max_workers : int, optional
+        Number of `solve-field` processes to run at the same time. Default is
+        half the number of CPUs.
+
+    kwd :
+        All other keyword arguments are passed to :func:`add_astrometry`.
+
+    Returns
+    -------
+    list of bool
+        Result of :func:`add_astrometry` for each file, in the same order as
+        `filenames`.
+
+    Notes
+    -----
+    astrometry.net names its intermediate files after the image without its
+    extension, and :func:`add_astrometry` cleans them up by that name, so
+    files like ``a.fit`` and ``a.fits`` would interfere with each other if
+    solved at the same time. Files that share a name apart from the
+    extension are therefore solved one after the other.
+    """
+    if max_workers is None:
+        max_workers = max(1, (cpu_count() or 1) // 2)
+
+    same_stem = {}
+    for idx, filename in enumerate(filenames):
+        same_stem.setdefault(path.splitext(filename)[0], []).append(idx)
+
+    def solve_group(indexes):
+        return [(idx, add_astrometry(filenames[idx], **kwd))
+                for idx in indexes]
+
+    results = [None] * len(filenames)
+    # The work is done by solve-field subprocesses, so threads are enough
+    # to keep several of them running at once.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for group in executor.map(solve_group, same_stem.values()):
+            for idx, solved in group:
+                results[idx] = solved
+    return results
+
+
 SExtractor_config = """
 # Configuration file for SExtractor 2.19.5 based on default by EB 2014-11-26
 #
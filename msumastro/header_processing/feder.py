@@ -15,6 +15,42 @@ __all__ = ['FederSite', 'ImageSoftware', 'Instrument', 'ApogeeAltaU9',
            'ApogeeAspenCG16', 'MaximDL4', 'MaximDL5']
 
 
+# Keywords Feder sets on images, as (name, comment, synonyms) tuples. Each
+# Feder instance builds its own FITSKeyword objects from these because the
+# keyword values are filled in per image.
+_LIGHT_FILE_KEYWORDS = (
+    ('ra', 'Approximate RA at EQUINOX', ['objctra']),
+    ('DEC', 'Approximate DEC at EQUINOX', ['objctdec']),
+    ('object', 'Target of the observations', None),
+    ('ha', 'Hour angle', None),
+    ('airmass', 'Airmass (Sec(Z)) at start of observation', ['secz']),
+    ('alt-obj', '[degrees] Altitude of object, no refraction', None),
+    ('az-obj', '[degrees] Azimuth of object, no refraction', None),
+)
+
+_SITE_KEYWORDS = (
+    ('latitude', '[degrees] Observatory latitude', ['sitelat']),
+    ('longitud', '[degrees east] Observatory longitude', 'sitelong'),
+    ('altitude', '[meters] Observatory altitude', None),
+)
+
+_TIME_KEYWORDS = (
+    ('LST', 'Local Sidereal Time at start of observation', None),
+    ('jd-obs', 'Julian Date at start of observation', None),
+    ('mjd-obs', 'Modified Julian date at start of observation', None),
+)
+
+_OVERSCAN_KEYWORDS = (
+    ('biassec', 'Useful region of the overscan', None),
+    ('trimsec', 'Region to keep after trimming overscan', None),
+)
+
+
+def _keywords_from_spec(spec):
+    return [FITSKeyword(name=name, comment=comment, synonyms=synonyms)
+            for name, comment, synonyms in spec]
+
+
 class FederSite(EarthLocation):
     """
     The Feder Observatory site.
@@ -122,36 +158,33 @@ class Instrument(object):
             Indicates whether or not image has overscan present.
         """
 
-        if self.trim_region is None:
+        if self._trim_slices is None:
             return False
 
-        # Grab the trim region as a slice to make it easier to access end
-        # points. Do *not* convert from FITS convention because input
-        # dimensions follow FITS conventions.
-        trim_dim = slice_from_string(self.trim_region)
-
-        dim_end = lambda ax: (trim_dim[ax].stop + 1
-                              if trim_dim[ax].stop is not None
-                              else image_dimensions[ax])
-        # print(trim_dim1, trim_dim2)
-        # if trim_dim1.stop is not None:
-        #     dim1_end = trim_dim1.stop + 1
-        # else:
-        #     # None means use the whole thing....
-        #     dim1_end = image_dimensions[0]
-
-        # if trim_dim2.stop is not None:
-        #     dim2_end = trim_dim2.stop + 1
-        # else:
-        #     # None means use the whole thing....
-        #     dim2_end = image_dimensions[1]
-
-        if (dim_end(0) < image_dimensions[0] or
-            dim_end(1) < image_dimensions[1]):
-
-            return True
+        # Compare the end points of the trim region to the image size. Do
+        # *not* convert from FITS convention because input dimensions follow
+        # FITS conventions. A stop of None means the whole axis is kept.
+        return any(trim.stop is not None and trim.stop + 1 < dimension
+                   for trim, dimension in zip(self._trim_slices,
+                                              image_dimensions))
+
+    @property
+    def trim_region(self):
+        """
+        Region of the CCD preserved after overscan subtraction, in FITS
+        convention.
+        """
+        return self._trim_region
+
+    @trim_region.setter
+    def trim_region(self, value):
+        self._trim_region = value
+        # has_overscan is called for every image, so parse the region once
+        # here instead of on each call.
+        if value is None:
+            self._trim_slices = None
         else:
-            return False
+            self._trim_slices = slice_from_string(value)
 
 
 class ApogeeAltaU9(Instrument):
@@ -416,12 +449,10 @@ class Feder(object):
         self._define_keywords_for_light_files()
         self._overscan_keywords = []
         self._define_overscan_keywords()
-        for key in chain(self.keywords_for_all_files,
-                         self.keywords_for_light_files,
-                         self.keywords_for_overscan):
-            name = key.name
-            name = name.replace('-', '_')
-            setattr(self, name, key)
+        for key in chain(self._keywords_for_all_files,
+                         self._keywords_for_light_files,
+                         self._overscan_keywords):
+            setattr(self, key.name.replace('-', '_'), key)
 
     @property
     def keywords_for_all_files(self):
@@ -448,47 +479,12 @@ class Feder(object):
         return self._overscan_keywords
 
     def _define_keywords_for_light_files(self):
-        RA = FITSKeyword(name='ra',
-                         comment='Approximate RA at EQUINOX',
-                         synonyms=['objctra'])
-
-        Dec = FITSKeyword(name='DEC',
-                          comment='Approximate DEC at EQUINOX',
-                          synonyms=['objctdec'])
-
-        target_object = FITSKeyword(name='object',
-                                    comment='Target of the observations')
-
-        hour_angle = FITSKeyword(name='ha',
-                                 comment='Hour angle')
-
-        airmass = FITSKeyword(name='airmass',
-                              comment='Airmass (Sec(Z)) at start of observation',
-                              synonyms=['secz'])
-
-        altitude = FITSKeyword(name='alt-obj',
-                               comment='[degrees] Altitude of object, no refraction')
-
-        azimuth = FITSKeyword(name='az-obj',
-                              comment='[degrees] Azimuth of object, no refraction')
-        self._keywords_for_light_files.append(RA)
-        self._keywords_for_light_files.append(Dec)
-        self._keywords_for_light_files.append(target_object)
-        self._keywords_for_light_files.append(hour_angle)
-        self._keywords_for_light_files.append(airmass)
-        self._keywords_for_light_files.append(altitude)
-        self._keywords_for_light_files.append(azimuth)
+        self._keywords_for_light_files.extend(
+            _keywords_from_spec(_LIGHT_FILE_KEYWORDS))
 
     def _set_site_keywords_values(self):
-        latitude = FITSKeyword(name="latitude",
-                               comment='[degrees] Observatory latitude',
-                               synonyms=['sitelat'])
-
-        longitude = FITSKeyword(name='longitud',
-                                comment='[degrees east] Observatory longitude',
-                                synonyms='sitelong')
-        obs_altitude = FITSKeyword(name='altitude',
-                                   comment='[meters] Observatory altitude')
+        latitude, longitude, obs_altitude = \
+            _keywords_from_spec(_SITE_KEYWORDS)
         lat_lon_format = {'sep': ':', 'pad': True, 'alwayssign': True}
         latitude.value = self.site.lat.to_string(**lat_lon_format)
         longitude.value = self.site.lon.to_string(**lat_lon_format)
@@ -497,22 +493,9 @@ class Feder(object):
                                             obs_altitude])
 
     def _time_keywords_to_set(self):
-        LST = FITSKeyword(name='LST',
-                          comment='Local Sidereal Time at start of observation')
-
-        JD = FITSKeyword(name='jd-obs',
-                         comment='Julian Date at start of observation')
-
-        MJD = FITSKeyword(name='mjd-obs',
-                          comment='Modified Julian date at start of observation')
-        self._keywords_for_all_files.extend([LST, JD, MJD])
+        self._keywords_for_all_files.extend(
+            _keywords_from_spec(_TIME_KEYWORDS))
 
     def _define_overscan_keywords(self):
-        overscan_region = FITSKeyword(name='biassec',
-                                    comment='Useful region of the overscan')
-
-        trim_region = FITSKeyword(name='trimsec',
-            comment=('Region to keep after trimming overscan'))
-
-        self._overscan_keywords.extend([overscan_region,
-                                       trim_region])
+        self._overscan_keywords.extend(
+            _keywords_from_spec(_OVERSCAN_KEYWORDS))
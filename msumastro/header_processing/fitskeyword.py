@@ -1,5 +1,6 @@
 import logging
 
+from astropy.io.fits import Card
 from astropy.io.fits import Header
 from astropy.io.fits import PrimaryHDU
 
@@ -7,6 +8,21 @@ logger = logging.getLogger(__name__)
 
 __all__ = ['FITSKeyword']
 
+# Marks a keyword missing from a header; None is a valid FITS value.
+_MISSING = object()
+
+
+def _header_from(hdu_or_header):
+    """
+    Get the header of a primary HDU, or the header itself if given one.
+    """
+    if isinstance(hdu_or_header, PrimaryHDU):
+        return hdu_or_header.header
+    elif isinstance(hdu_or_header, Header):
+        return hdu_or_header
+    else:
+        raise ValueError('argument must be a fits Primary HDU or header')
+
 
 class FITSKeyword(object):
 
@@ -33,8 +49,12 @@ class FITSKeyword(object):
         header and to set multiple keywords to the same value in a FITS header.
     """
 
+    # Keywords have a fixed set of attributes; with slots, assigning a
+    # misspelled one raises an error instead of silently adding it.
+    __slots__ = ('_name', 'value', 'comment', '_synonyms', '_names',
+                 '_match_names')
+
     def __init__(self, name=None, value=None, comment=None, synonyms=None):
-        self._hdr = Header()
         self.name = name
         self.value = value
         self.comment = comment
@@ -48,9 +68,10 @@ class FITSKeyword(object):
             value_string = ''
         else:
             value_string = str(self.value)
+        # names are stored upper case already, see _set_keyword_case
         return ("%s = %s    / %s \n with synonyms: %s" %
-                (self.name.upper(), value_string, self.comment,
-                 ",".join([str(syn).upper() for syn in self.synonyms])))
+                (self.name, value_string, self.comment,
+                 ",".join(self._synonyms)))
 
     def _set_keyword_case(self, keyword):
         return keyword.upper()
@@ -81,9 +102,8 @@ class FITSKeyword(object):
     @synonyms.setter
     def synonyms(self, inp_synonyms):
         if not inp_synonyms:
-            self._synonyms = []
-            return
-        if isinstance(inp_synonyms, str):
+            synonym_list = []
+        elif isinstance(inp_synonyms, str):
             synonym_list = [inp_synonyms]
         elif isinstance(inp_synonyms, list):
             synonym_list = set(inp_synonyms)
@@ -93,6 +113,12 @@ class FITSKeyword(object):
         synonym_list = [self._set_keyword_case(syn) for syn in synonym_list]
         self._synonyms = [synonym for synonym in synonym_list
                           if synonym != self.name]
+        # names are looked up for every header the keyword is read from or
+        # written to, so build them once here rather than on each use.
+        self._names = (self.name,) + tuple(self._synonyms)
+        # all names are stored upper case, so one set lookup is enough to
+        # match any case of any name.
+        self._match_names = frozenset(self._names)
         return
 
     @property
@@ -100,10 +126,26 @@ class FITSKeyword(object):
         """
         All names, including synonyms, for this keyword, as a list.
         """
-        all_names = [self.name]
-        if self.synonyms:
-            all_names.extend(self.synonyms)
-        return all_names
+        return list(self._names)
+
+    def matches(self, keyword):
+        """
+        Determine whether a keyword name is a name of this keyword.
+
+        Parameters
+        ----------
+
+        keyword : str
+            Name to check; case insensitive.
+
+        Returns
+        -------
+
+        bool
+            ``True`` if `keyword` is the name or one of the synonyms of this
+            keyword.
+        """
+        return keyword.upper() in self._match_names
 
     def history_comment(self, with_name=None):
         """
@@ -140,21 +182,52 @@ class FITSKeyword(object):
             a history comment is added for *each* of the keyword names added
             to the header, including synonyms.
         """
-        if isinstance(hdu_or_header, PrimaryHDU):
-            header = hdu_or_header.header
-        elif isinstance(hdu_or_header, Header):
-            header = hdu_or_header
-        else:
-            raise ValueError('argument must be a fits Primary HDU or header')
-
-        header[self.name] = (self.value, self.comment)
-        if history:
-            header.add_history(self.history_comment())
-        if with_synonyms and self.synonyms:
-            for synonym in self.synonyms:
-                header[synonym] = (self.value, self.comment)
+        self.add_all_to_header([self], hdu_or_header,
+                               with_synonyms=with_synonyms, history=history)
+
+    @classmethod
+    def add_all_to_header(cls, keywords, hdu_or_header, with_synonyms=True,
+                          history=False):
+        """
+        Add several keywords to FITS header.
+
+        The cards for all of the keywords (and, if requested, their history
+        comments) are built first and then applied to the header with a
+        single ``update`` and a single ``extend``. All history comments
+        come after the keyword values, in the order the keywords are given.
+
+        Parameters
+        ----------
+
+        keywords : list of FITSKeyword
+            Keywords to be added to the header.
+
+        hdu_or_header : astropy.io.fits.Header or astropy.io.fits.PrimaryHDU
+            Header/HDU to which the keywords are to be added.
+
+        with_synonyms : bool, optional
+            Control whether a keyword is added for each of the synonyms of
+            each keyword. Default is True.
+
+        history : bool, optional
+            Control whether history comments are added to the header; if True
+            a history comment is added for *each* of the keyword names added
+            to the header, including synonyms.
+        """
+        header = _header_from(hdu_or_header)
+        cards = []
+        history_cards = []
+        for keyword in keywords:
+            names = keyword._names if with_synonyms else keyword._names[:1]
+            for name in names:
+                cards.append(Card(name, keyword.value, keyword.comment))
                 if history:
-                    header.add_history(self.history_comment(with_name=synonym))
+                    history_cards.append(
+                        Card('HISTORY',
+                             keyword.history_comment(with_name=name)))
+        header.update(cards)
+        if history_cards:
+            header.extend(history_cards)
 
     def set_value_from_header(self, hdu_or_header):
         """
@@ -178,24 +251,21 @@ class FITSKeyword(object):
             (or synonyms) are not found in the header, or multiple
             non-identical values are found.
         """
-        if isinstance(hdu_or_header, PrimaryHDU):
-            header = hdu_or_header.header
-        elif isinstance(hdu_or_header, Header):
-            header = hdu_or_header
-        else:
-            raise ValueError('argument must be a fits Primary HDU or header')
-        values = []
-        for name in self.names:
-            try:
-                values.append(header[name])
-            except KeyError:
-                continue
-        if values:
-            if len(set(values)) > 1:
-                error_msg = 'Found multiple values for keyword %s:\nValues: %s'
-                raise ValueError(error_msg %
-                                 (','.join(self.names),
-                                  ','.join([str(v) for v in values])))
-            self.value = values[0]
-        else:
+        header = _header_from(hdu_or_header)
+        # Keep every value found, with its name, so that a conflict can be
+        # reported in full.
+        found = []
+        for name in self._names:
+            value = header.get(name, _MISSING)
+            if value is not _MISSING:
+                found.append((name, value))
+        if not found:
             raise ValueError('Keyword not found in header: %s' % self)
+        value = found[0][1]
+        if any(other != value for _, other in found[1:]):
+            error_msg = 'Found multiple values for keyword %s:\nValues: %s'
+            raise ValueError(error_msg %
+                             (','.join(self._names),
+                              ','.join('%s=%s' % (name, str(v))
+                                       for name, v in found)))
+        self.value = value
@@ -1,7 +1,11 @@
 from os import path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 from socket import timeout
+from threading import Lock
+from time import sleep
 from urllib import parse
 
 import numpy as np
@@ -10,13 +14,14 @@ from astropy.time import Time
 from astropy.coordinates import Angle, name_resolve, SkyCoord, AltAz
 from astropy import units as u
 from astropy.table import Table
+from astropy.utils import iers
+from astropy.utils.data import download_file
 from ccdproc import ImageFileCollection
 
 try:
     from .feder import Feder
-    feder = Feder()
 except ImportError:
-    feder = None
+    Feder = None
     pass
 
 from .fitskeyword import FITSKeyword
@@ -24,9 +29,35 @@ from .fitskeyword import FITSKeyword
 logger = logging.getLogger(__name__)
 
 
+class _LazyFeder(object):
+    """
+    Stand-in for the shared `Feder` instance that builds it on first use.
+
+    Building `Feder` sets up the site, instruments, software and keywords,
+    which is wasted work for code that imports this module without patching
+    any headers. The first use may come from several threads at once, so
+    building the instance is guarded by a lock.
+    """
+    def __init__(self):
+        self._lock = Lock()
+
+    def __getattr__(self, name):
+        instance = self.__dict__.get('_instance')
+        if instance is None:
+            with self._lock:
+                instance = self.__dict__.get('_instance')
+                if instance is None:
+                    instance = self.__dict__['_instance'] = Feder()
+        return getattr(instance, name)
+
+
+feder = _LazyFeder() if Feder is not None else None
+
+
 #__all__ = ['patch_headers', 'add_object_info', 'add_ra_dec_from_object_name']
 
 
+@lru_cache(maxsize=32)
 def IRAF_image_type(image_type):
     """
     Convert MaximDL default image type names to IRAF
@@ -57,8 +88,6 @@ def _lst_from_obstime(obstime):
     except IndexError:
         # We are outside the range of the IERS table installed with astropy,
         # so get a newer one.
-        from astropy.utils import iers
-        from astropy.utils.data import download_file
         iers_a = iers.IERS_A.open(download_file(iers.IERS_A_URL,
                                   cache=True))
         obstime.delta_ut1_utc = obstime.get_delta_ut1_utc(iers_a)
@@ -87,8 +116,9 @@ def add_time_info(header, history=False):
     feder.LST.value = LST_tmp.to_string(unit=u.hour, sep=':', precision=4,
                                         pad=True)
 
+    FITSKeyword.add_all_to_header(feder.keywords_for_all_files, header,
+                                  history=history)
     for keyword in feder.keywords_for_all_files:
-        keyword.add_to_header(header, history=history)
         logger.info(keyword.history_comment())
 
 
@@ -142,10 +172,13 @@ def add_object_pos_airmass(header, history=False):
 
     feder.HA.value = HA.to_string(unit=u.hour, sep=':')
 
-    for keyword in feder.keywords_for_light_files:
-        if keyword.value is not None:
-            keyword.add_to_header(header, history=history)
-            logger.info(keyword.history_comment())
+    keywords_with_values = [keyword for keyword
+                            in feder.keywords_for_light_files
+                            if keyword.value is not None]
+    FITSKeyword.add_all_to_header(keywords_with_values, header,
+                                  history=history)
+    for keyword in keywords_with_values:
+        logger.info(keyword.history_comment())
 
 
 def get_software_name(header, file_name=None, use_observatory=None):
@@ -295,6 +328,113 @@ def list_name_is_url(name):
     return (may_be_url.scheme and may_be_url.netloc)
 
 
+# Number of tries, and the delay in seconds before the first retry, for
+# name lookups that fail because the resolver could not be reached.
+_LOOKUP_ATTEMPTS = 4
+_LOOKUP_FIRST_DELAY = 0.5
+_LOOKUP_MAX_DELAY = 8
+
+
+def _lookup_failure_is_transient(error):
+    """
+    Decide whether a failed name lookup is worth retrying.
+
+    A name the resolver does not know will not become known by asking
+    again, but a dropped or timed out connection often succeeds on retry.
+    """
+    if isinstance(error, (timeout, ConnectionError)):
+        return True
+    # astropy wraps connection problems in a NameResolveError whose message
+    # says the coordinates could not be retrieved ("All Sesame queries
+    # failed. Unable to retrieve coordinates."). There is no separate
+    # exception type for this, so the check depends on astropy's wording;
+    # test_object_lookup_retries_when_sesame_is_unreachable will notice if
+    # that wording changes.
+    return 'Unable to retrieve' in str(error)
+
+
+@lru_cache(maxsize=4096)
+def _lookup_object_position(normalized_name):
+    delay = _LOOKUP_FIRST_DELAY
+    for attempt in range(1, _LOOKUP_ATTEMPTS + 1):
+        try:
+            return SkyCoord.from_name(normalized_name)
+        except (name_resolve.NameResolveError, timeout,
+                ConnectionError) as e:
+            if not _lookup_failure_is_transient(e):
+                raise
+            if attempt == _LOOKUP_ATTEMPTS:
+                if isinstance(e, ConnectionError):
+                    # Callers handle lookup failures as NameResolveError
+                    raise name_resolve.NameResolveError(
+                        'Unable to retrieve coordinates for {}: '
+                        '{}'.format(normalized_name, e)) from e
+                raise
+            logger.debug('Lookup of %s failed (%s), retrying in %s seconds',
+                         normalized_name, e, delay)
+            sleep(delay)
+            delay = min(2 * delay, _LOOKUP_MAX_DELAY)
+
+
+def _normalize_object_name(object_name):
+    return ' '.join(object_name.lower().split())
+
+
+def _object_position(object_name):
+    """
+    Look up the position of an object by name.
+
+    Lookups are cached, so each object is looked up only once no matter how
+    many times it is requested. Names which differ only in case or
+    whitespace are treated as the same object.
+
+    Parameters
+    ----------
+    object_name : str
+        Name of the object.
+
+    Returns
+    -------
+    astropy.coordinates.SkyCoord
+        Position of the object.
+    """
+    return _lookup_object_position(_normalize_object_name(object_name))
+
+
+def _coordinates_from_names(object_names, max_workers=6):
+    """
+    Look up positions for a list of object names.
+
+    Parameters
+    ----------
+    object_names : list of str
+        Names of the objects; each distinct name is looked up only once,
+        with names that differ only in case or whitespace treated as the same.
+
+    max_workers : int, optional
+        Maximum number of lookups to have in progress at the same time. The
+        default is chosen to stay within the query rate Simbad allows.
+
+    Returns
+    -------
+    astropy.coordinates.SkyCoord
+        Coordinates with one entry for each element of `object_names`.
+    """
+    # Normalize before removing duplicates; otherwise variants of one name
+    # would be looked up at the same time and all miss the cache.
+    normalized = [_normalize_object_name(name) for name in object_names]
+    unique_names, name_index = np.unique(normalized, return_inverse=True)
+    # tolist() gives plain str; lru_cache keys numpy strings differently, so
+    # they would miss entries made by _object_position and vice versa.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        coords = list(executor.map(_lookup_object_position,
+                                   unique_names.tolist()))
+    ra = np.array([a_coord.ra.radian for a_coord in coords])
+    dec = np.array([a_coord.dec.radian for a_coord in coords])
+    return SkyCoord(ra[name_index], dec[name_index],
+                    unit=(u.radian, u.radian), frame='fk5')
+
+
 def read_object_list(directory=None, input_list=None,
                      skip_consistency_check=False, check_radius=20.0,
                      skip_lookup_from_object_name=False):
@@ -433,18 +573,12 @@ def read_object_list(directory=None, input_list=None,
             ra_dec = None
         else:
             try:
-                ra_dec = [SkyCoord.from_name(obj) for obj in object_names]
+                ra_dec = _coordinates_from_names(object_names)
             except (name_resolve.NameResolveError, timeout) as e:
                 logger.error('Unable to do lookup of object positions')
                 logger.error(e)
                 raise name_resolve.NameResolveError('Unable to do lookup of '
                                                     'object positions')
-            ra = []
-            dec = []
-            for a_coord in ra_dec:
-                ra.append(a_coord.ra.radian)
-                dec.append(a_coord.dec.radian)
-            ra_dec = SkyCoord(ra, dec, unit=(u.radian, u.radian), frame='fk5')
 
     if skip_consistency_check and skip_lookup_from_object_name:
         return object_names, ra_dec
@@ -652,9 +786,9 @@ def add_overscan_header(header, history=True):
         trim_region = feder.TRIMSEC
         overscan_region.value = instrument.useful_overscan
         trim_region.value = instrument.trim_region
-        overscan_region.add_to_header(header, history=history)
-        trim_region.add_to_header(header, history=history)
         modified_keywords.extend([overscan_region, trim_region])
+        FITSKeyword.add_all_to_header(modified_keywords, header,
+                                      history=history)
 
     for keyword in modified_keywords:
         logger.info(keyword.history_comment())
@@ -711,6 +845,18 @@ def add_object_info(directory=None,
                                            'dec', 'object'])
     im_table = images.summary
 
+    # I want rows which...
+    #
+    # ...have no OBJECT...
+    needs_object = im_table['object'].mask
+    # ...and have coordinates.
+    needs_object &= ~ (im_table['ra'].mask | im_table['dec'].mask)
+
+    if not needs_object.any():
+        # Nothing to match, so don't read (or look up) the object list.
+        logger.info('NO OBJECTS MATCHED TO IMAGES IN: {0}'.format(directory))
+        return
+
     object_dir = directory if object_list_dir is None else object_list_dir
 
     logger.debug('About to read object list')
@@ -727,13 +873,6 @@ def add_object_info(directory=None,
 
     object_names = np.array(object_names)
 
-    # I want rows which...
-    #
-    # ...have no OBJECT...
-    needs_object = im_table['object'].mask
-    # ...and have coordinates.
-    needs_object &= ~ (im_table['ra'].mask | im_table['dec'].mask)
-
     logger.debug('Looking for objects for %s images', needs_object.sum())
     # Qualifying rows need a search for a match.
     # the search returns a match for every row provided, but some matches
@@ -804,6 +943,13 @@ def add_ra_dec_from_object_name(directory=None, new_file_ext=None,
         Directory in which the `object_list` is contained. Default is
         `directory`.
 
+    Notes
+    -----
+    Only the objects that appear in images without a position are looked
+    up. As a result, an object list that has only names, with no RA/Dec, is
+    not checked for objects closer together than the match radius the way
+    :func:`read_object_list` does; that would require looking up every
+    object on the list. Lists that include RA/Dec are still checked.
     """
     directory = directory or '.'
     if new_file_ext is None:
@@ -821,28 +967,38 @@ def add_ra_dec_from_object_name(directory=None, new_file_ext=None,
     if not missing_dec:
         return
 
-    objects = np.unique(missing_dec['object'])
+    # Group the images by object once instead of scanning the whole table
+    # for each object name.
+    by_object = missing_dec.group_by('object')
 
+    # Positions are only taken from the list if it provides them; names
+    # without positions are looked up below, and only for objects that
+    # actually appear in the images.
     try:
-        object_list, ra_dec_list = read_object_list(object_list_dir,
-                                                    input_list=object_list)
+        object_list, ra_dec_list = \
+            read_object_list(object_list_dir,
+                             input_list=object_list,
+                             skip_lookup_from_object_name=True)
     except IOError:
         object_list = []
-        ra_dec_list = []
-        object_dict = {}
+        ra_dec_list = None
 
-    if len(object_list) and len(ra_dec_list):
-        object_dict = {obj: ra_dec for obj, ra_dec in zip(object_list,
-                                                          ra_dec_list)}
+    # Map names to positions in the list rather than splitting ra_dec_list
+    # into one coordinate object per entry; only the objects actually
+    # needed are pulled out of it below.
+    object_index = {}
+    if ra_dec_list is not None and len(ra_dec_list):
+        object_index = {obj: idx for idx, obj in enumerate(object_list)}
 
     # checks prior to this mean this loop always happens at least once,
     # which confuses coverage
-    for object_name in objects:  # pragma: nobranch
+    for these_files in by_object.groups:  # pragma: nobranch
+        object_name = these_files['object'][0]
         try:
-            object_coords = object_dict[object_name]
+            object_coords = ra_dec_list[object_index[object_name]]
         except KeyError:
             try:
-                object_coords = SkyCoord.from_name(object_name)
+                object_coords = _object_position(object_name)
             except (name_resolve.NameResolveError, timeout) as e:
                 logger.warning('Unable to lookup position for %s', object_name)
                 logger.warning(e)
@@ -856,7 +1012,6 @@ def add_ra_dec_from_object_name(directory=None, new_file_ext=None,
         feder.DEC.value = object_coords.dec.to_string(unit=u.degree,
                                                       alwayssign=True,
                                                       **common_format_keywords)
-        these_files = missing_dec[missing_dec['object'] == object_name]
         for image in these_files:
             full_name = path.join(directory, image['file'])
             hdulist = fits.open(full_name, do_not_scale_image_data=True)
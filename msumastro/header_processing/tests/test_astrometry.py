@@ -0,0 +1,91 @@
+import time
+import threading
+from os import path
+from shutil import rmtree
+
+from .. import astrometry as ast
+
+
+def test_add_astrometry_many_keeps_order_and_passes_keywords(monkeypatch):
+    calls = []
+
+    def fake_add_astrometry(filename, **kwd):
+        calls.append((filename, kwd))
+        return filename.startswith('good')
+
+    monkeypatch.setattr(ast, 'add_astrometry', fake_add_astrometry)
+    filenames = ['good1.fit', 'bad.fit', 'good2.fits']
+    result = ast.add_astrometry_many(filenames, max_workers=3,
+                                     overwrite=True, odds_ratio=1e6)
+    assert result == [True, False, True]
+    assert sorted(fname for fname, _ in calls) == sorted(filenames)
+    for _, kwd in calls:
+        assert kwd == {'overwrite': True, 'odds_ratio': 1e6}
+
+
+def test_add_astrometry_many_serializes_files_with_same_stem(monkeypatch):
+    lock = threading.Lock()
+    active = []
+    overlapped = []
+
+    def fake_add_astrometry(filename, **kwd):
+        stem = path.splitext(filename)[0]
+        with lock:
+            if stem in active:
+                overlapped.append(filename)
+            active.append(stem)
+        time.sleep(0.05)
+        with lock:
+            active.remove(stem)
+        return True
+
+    monkeypatch.setattr(ast, 'add_astrometry', fake_add_astrometry)
+    filenames = ['a.fit', 'a.fits', 'b.fit', 'b.fits']
+    result = ast.add_astrometry_many(filenames, max_workers=4)
+    assert result == [True] * len(filenames)
+    assert not overlapped
+
+
+def test_call_astrometry_command_line(monkeypatch):
+    commands = []
+
+    def fake_check_output(command, **kwd):
+        commands.append(command)
+        return b''
+
+    monkeypatch.setattr(ast.subprocess, 'check_output', fake_check_output)
+    status = ast.call_astrometry('img.fit',
+                                 ra_dec=('14 03 12', '+54 20 55'),
+                                 odds_ratio=1e6,
+                                 additional_args=['--downsample 2'])
+    assert status == 0
+    assert commands == [[
+        'solve-field', '--obj', '100',
+        '--scale-low', '0.5', '--scale-high', '0.6',
+        '--scale-units', 'arcsecperpix',
+        '--no-plot',
+        '--corr', 'none', '--rdls', 'none', '--match', 'none',
+        '--wcs', 'none',
+        '--crpix-center',
+        '--downsample', '2',
+        '--ra', '14 03 12', '--dec', '+54 20 55', '--radius', '0.5',
+        '--odds-to-solve', '1000000.0',
+        'img.fit'
+    ]]
+
+
+def test_call_astrometry_rewrites_removed_sextractor_config(monkeypatch):
+    configs = []
+
+    def fake_check_output(command, **kwd):
+        config = command[command.index('--source-extractor-config') + 1]
+        configs.append(config)
+        assert path.exists(config)
+        return b''
+
+    monkeypatch.setattr(ast.subprocess, 'check_output', fake_check_output)
+    for _ in range(2):
+        ast.call_astrometry('img.fit', custom_sextractor_config=True)
+        # Simulate a cleaner removing the temporary files between solves
+        rmtree(path.dirname(configs[-1]))
+    assert len(configs) == 2
@@ -10,6 +10,14 @@ def test_apogee_alta_has_overscan():
     assert not (apogee_alta.has_overscan([3073, 2048]))
 
 
+def test_has_overscan_follows_changed_trim_region():
+    apogee_alta = ApogeeAltaU9()
+    apogee_alta.trim_region = '[1:3085, :]'
+    assert not apogee_alta.has_overscan([3085, 2048])
+    apogee_alta.trim_region = None
+    assert not apogee_alta.has_overscan([3085, 2048])
+
+
 def test_apogee_alta_fits_names():
     feder_obj = Feder()
     assert isinstance(feder_obj.instruments["Apogee Alta"],
@@ -31,6 +31,18 @@ class TestGoodFITSKeyword(object):
         assert (self.keyword.names == [self.keyword.name,
                 self.keyword.synonyms[0], self.keyword.synonyms[1]])
 
+    def test_matches(self):
+        for name in self.keyword.names:
+            assert self.keyword.matches(name)
+            assert self.keyword.matches(name.lower())
+        assert not self.keyword.matches('not' + self.name)
+
+    def test_matches_after_name_change(self):
+        k = FITSKeyword(name=self.name, synonyms=self.synonyms)
+        k.name = 'newname'
+        assert k.matches('NewName')
+        assert not k.matches(self.name)
+
     def test_history_comment(self):
         assert (self.keyword.history_comment() ==
                 "Updated keyword KWD to value 12")
@@ -65,6 +77,36 @@ class TestGoodFITSKeyword(object):
         for name in self.keyword.names:
             assert clean_hdu.header[name] == self.keyword.value
 
+    def test_add_all_to_header(self):
+        # One synonym each, since the order of several synonyms is not fixed
+        first = FITSKeyword(name='kwd', value=12, comment='This is a comment',
+                            synonyms='kwdalt')
+        second = FITSKeyword(name='other', value='a value',
+                             comment='another comment', synonyms='otheralt')
+        hdu = PrimaryHDU()
+        hdu.header['kwdalt'] = (0, 'old value')
+        hdu.header.add_history('existing history')
+        FITSKeyword.add_all_to_header([first, second], hdu, history=True)
+        expected = [
+            ('KWDALT', 12, 'This is a comment'),
+            ('KWD', 12, 'This is a comment'),
+            ('OTHER', 'a value', 'another comment'),
+            ('OTHERALT', 'a value', 'another comment'),
+            ('HISTORY', 'existing history', ''),
+            ('HISTORY', 'Updated keyword KWD to value 12', ''),
+            ('HISTORY', 'Updated keyword KWDALT to value 12', ''),
+            ('HISTORY', 'Updated keyword OTHER to value a value', ''),
+            ('HISTORY', 'Updated keyword OTHERALT to value a value', ''),
+        ]
+        # Skip the mandatory cards (SIMPLE, BITPIX, ...) of the empty HDU
+        n_mandatory = len(PrimaryHDU().header)
+        cards = [tuple(card) for card in hdu.header.cards[n_mandatory:]]
+        assert cards == expected
+
+    def test_no_instance_dict(self):
+        with pytest.raises(AttributeError):
+            self.keyword.not_an_attribute = 1
+
     def test_handling_of_duplicate_synonyms(self):
         # should fail if duplicate synonyms are not removed in initialization
         bad_synonyms = ['bad', 'bad']
@@ -130,3 +172,12 @@ class TestGoodFITSKeyword(object):
         self.hdu.header[self.synonyms[0]] = 7 * new_value
         with pytest.raises(ValueError):
             self.keyword.set_value_from_header(self.hdu.header)
+
+    def test_multiple_values_error_lists_every_value(self):
+        self.hdu.header[self.name] = 1
+        self.hdu.header[self.synonyms[0]] = 2
+        self.hdu.header[self.synonyms[1]] = 3
+        with pytest.raises(ValueError) as err:
+            self.keyword.set_value_from_header(self.hdu.header)
+        for name, value in zip([self.name] + self.synonyms, [1, 2, 3]):
+            assert '%s=%s' % (name.upper(), value) in str(err.value)
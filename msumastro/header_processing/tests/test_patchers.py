@@ -4,8 +4,10 @@ from tempfile import mkdtemp
 from glob import glob
 import warnings
 import logging
+import time
 from socket import timeout
 import urllib
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import numpy as np
@@ -79,6 +81,104 @@ def test_read_object_list_with_skip_consistency_skip_lookup():
     assert len(ra_dec) == 2
 
 
+def test_read_object_list_looks_up_each_name_once(fake_resolver):
+    # A slow resolver makes lookups overlap, so a name variant that is not
+    # recognized as a duplicate would be looked up again.
+    fake_resolver.delay = 0.2
+    object_table = Table(data=[['m101', 'ey uma', 'M101 ', 'M101']],
+                         names=['object'])
+    object_table.write(path.join(_test_dir, _default_object_file_name),
+                       format='ascii', overwrite=True)
+    objects, ra_dec = ph.read_object_list(_test_dir,
+                                          skip_consistency_check=True)
+    assert sorted(fake_resolver.looked_up) == ['ey uma', 'm101']
+    assert len(ra_dec) == len(objects)
+    assert ra_dec[0].separation(ra_dec[2]).arcsec < 1e-4
+    assert ra_dec[0].separation(ra_dec[1]).arcsec > 1
+    # A second read should be answered entirely from the cache
+    ph.read_object_list(_test_dir, skip_consistency_check=True)
+    assert len(fake_resolver.looked_up) == 2
+    # and so should a lookup of a single name from the list
+    ph._object_position('m101')
+    assert len(fake_resolver.looked_up) == 2
+
+
+def test_object_lookup_retries_transient_failures(fake_resolver):
+    fake_resolver.positions['m101'] = SkyCoord(10, 45, unit='degree')
+    fake_resolver.failures = [
+        ConnectionResetError('connection reset by peer'),
+        ConnectionResetError('connection reset by peer')
+    ]
+    coord = ph._object_position('m101')
+    assert len(fake_resolver.looked_up) == 3
+    assert_allclose(coord.ra.degree, 10)
+
+
+def test_object_lookup_reports_lost_connection_as_resolve_error(
+        fake_resolver):
+    fake_resolver.failures = [
+        ConnectionResetError('connection reset by peer')
+    ] * ph._LOOKUP_ATTEMPTS
+    with pytest.raises(name_resolve.NameResolveError):
+        ph._object_position('m101')
+    assert len(fake_resolver.looked_up) == ph._LOOKUP_ATTEMPTS
+
+
+def test_object_lookup_retries_when_sesame_is_unreachable(monkeypatch,
+                                                          clear_lookup_cache):
+    # Use astropy's own resolver so that the error, and its message, are
+    # exactly what astropy raises when it cannot reach any Sesame server.
+    attempts = []
+
+    def unreachable(url, **kwd):
+        attempts.append(url)
+        raise urllib.error.URLError('network is unreachable')
+
+    monkeypatch.setattr(name_resolve, 'download_file', unreachable)
+    monkeypatch.setattr(ph, 'sleep', lambda delay: None)
+    with pytest.raises(name_resolve.NameResolveError) as err:
+        ph._object_position('m101')
+    assert ph._lookup_failure_is_transient(err.value)
+    n_urls = len(attempts) // ph._LOOKUP_ATTEMPTS
+    assert n_urls > 0
+    assert len(attempts) == n_urls * ph._LOOKUP_ATTEMPTS
+
+
+def test_object_lookup_does_not_retry_unknown_names(fake_resolver):
+    fake_resolver.failures = [
+        name_resolve.NameResolveError('Unable to find coordinates for name')
+    ]
+    with pytest.raises(name_resolve.NameResolveError):
+        ph._object_position('not a real object')
+    assert len(fake_resolver.looked_up) == 1
+
+
+def test_lazy_feder_is_built_on_first_use():
+    lazy = ph._LazyFeder()
+    assert '_instance' not in lazy.__dict__
+    assert lazy.RA.name == 'RA'
+    instance = lazy.__dict__['_instance']
+    assert isinstance(instance, Feder)
+    # the same instance is used from then on
+    assert lazy.RA is instance.RA
+
+
+def test_lazy_feder_is_built_once_by_concurrent_first_use(monkeypatch):
+    built = []
+
+    def slow_feder():
+        built.append(1)
+        time.sleep(0.05)
+        return Feder()
+
+    monkeypatch.setattr(ph, 'Feder', slow_feder)
+    lazy = ph._LazyFeder()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        names = list(executor.map(lambda _: lazy.RA.name, range(4)))
+    assert names == ['RA'] * 4
+    assert len(built) == 1
+
+
 def test_history_bad_mode():
     with pytest.raises(ValueError):
         ph.history(test_history_bad_mode, mode='not a mode')
@@ -365,6 +465,8 @@ def test_ambiguous_object_file_raises_error():
 
 def test_missing_object_file_issues_warning(caplog):
     remove(path.join(_test_dir, _default_object_file_name))
+    # add RA/Dec so that there are images that need an object
+    ph.patch_headers(_test_dir, new_file_ext='', overwrite=True)
     ph.add_object_info(_test_dir)
     patch_header_warnings = get_patch_header_logs(caplog)
     assert 'No object list in directory' in patch_header_warnings
@@ -407,11 +509,26 @@ def test_read_object_list_logs_error_if_object_on_list_not_found(caplog):
         ph.read_object_list(_test_dir)
     errs = get_patch_header_logs(caplog, level=logging.ERROR)
     assert 'Unable to do lookup' in errs
+    # add RA/Dec so that there are images that need an object
+    ph.patch_headers(_test_dir, new_file_ext='', overwrite=True)
     ph.add_object_info(_test_dir)
     errs = get_patch_header_logs(caplog, level=logging.ERROR)
     assert 'Unable to add objects--name resolve error' in errs
 
 
+def test_add_object_info_does_not_read_list_if_no_image_needs_object(
+        monkeypatch, caplog):
+    # None of the test images has both RA/Dec and no object
+    def fail_to_read(*args, **kwd):
+        raise AssertionError('object list should not be read')
+
+    monkeypatch.setattr(ph, 'read_object_list', fail_to_read)
+    caplog.set_level(logging.INFO)
+    ph.add_object_info(_test_dir)
+    infos = get_patch_header_logs(caplog, level=logging.INFO)
+    assert 'NO OBJECTS MATCHED' in infos
+
+
 @pytest.mark.xfail
 def test_add_object_name_logic_when_all_images_have_matching_object(caplog):
     ic = ImageFileCollection(_test_dir, keywords=['imagetyp'])
@@ -498,6 +615,82 @@ def test_add_ra_dec_from_object_name_edge_cases(caplog):
     assert 'Unable to lookup' in warns
 
 
+def test_add_ra_dec_from_object_name_only_looks_up_needed_objects(
+        fake_resolver):
+    object_table = Table(data=[['m101', 'ey uma', 'sz lyn']],
+                         names=['object'])
+    object_table.write(path.join(_test_dir, _default_object_file_name),
+                       format='ascii', overwrite=True)
+    ic = ImageFileCollection(_test_dir, keywords=['imagetyp'])
+    for h in ic.headers(imagetyp='light', overwrite=True):
+        h['dec'] = '+17:42:00'
+        h['ra'] = '03:45:06'
+        h['object'] = 'm101'
+
+    image_path = path.join(_test_dir, _test_image_name)
+    with fits.open(image_path) as f:
+        h = f[0].header
+        del h['RA']
+        del h['dec']
+        f.writeto(image_path, overwrite=True)
+
+    ph.add_ra_dec_from_object_name(_test_dir, object_list_dir=_test_dir)
+    assert fake_resolver.looked_up == ['m101']
+
+
+def test_add_ra_dec_from_object_name_skips_check_of_name_only_list(
+        fake_resolver):
+    # Both names resolve to the same place, which read_object_list rejects,
+    # but only m101 is needed so the list is not checked.
+    same_place = SkyCoord(210.8, 54.35, unit='degree')
+    fake_resolver.positions.update({'m101': same_place,
+                                    'ey uma': same_place})
+    object_table = Table(data=[['m101', 'ey uma']], names=['object'])
+    object_table.write(path.join(_test_dir, _default_object_file_name),
+                       format='ascii', overwrite=True)
+    with pytest.raises(RuntimeError):
+        ph.read_object_list(_test_dir)
+    fake_resolver.looked_up[:] = []
+
+    ic = ImageFileCollection(_test_dir, keywords=['imagetyp'])
+    for h in ic.headers(imagetyp='light', overwrite=True):
+        for key in ['ra', 'dec', 'objctra', 'objctdec']:
+            h.remove(key, ignore_missing=True)
+        h['object'] = 'm101'
+
+    ph.add_ra_dec_from_object_name(_test_dir, object_list_dir=_test_dir,
+                                   new_file_ext='')
+    assert fake_resolver.looked_up == []
+    h = fits.getheader(path.join(_test_dir, _test_image_name))
+    header_coords = SkyCoord(ra=h['ra'], dec=h['dec'],
+                             unit=(u.hour, u.degree))
+    assert header_coords.separation(same_place).arcsec < 1
+
+
+def test_add_ra_dec_from_object_name_several_objects(fake_resolver):
+    positions = {'m101': SkyCoord(210.8, 54.35, unit='degree'),
+                 'ey uma': SkyCoord(130.5, 49.8, unit='degree')}
+    fake_resolver.positions.update(positions)
+    ic = ImageFileCollection(_test_dir, keywords=['imagetyp'])
+    objects = {}
+    for idx, h in enumerate(ic.headers(imagetyp='light', overwrite=True,
+                                       return_fname=True)):
+        h, fname = h
+        for key in ['ra', 'dec', 'objctra', 'objctdec']:
+            h.remove(key, ignore_missing=True)
+        h['object'] = 'm101' if idx % 2 else 'ey uma'
+        objects[fname] = h['object']
+    assert set(objects.values()) == set(positions)
+
+    ph.add_ra_dec_from_object_name(_test_dir, new_file_ext='')
+
+    for fname, object_name in objects.items():
+        h = fits.getheader(path.join(_test_dir, fname))
+        header_coords = SkyCoord(ra=h['ra'], dec=h['dec'],
+                                 unit=(u.hour, u.degree))
+        assert header_coords.separation(positions[object_name]).arcsec < 1
+
+
 def get_patch_header_logs(log, level=logging.WARN):
     patch_header_warnings = []
     for record in log.records:
@@ -664,6 +857,47 @@ def object_file_no_ra(request):
     object_file.close()
 
 
+class FakeResolver(object):
+    """
+    Stand-in for ``SkyCoord.from_name`` that records each name looked up.
+
+    Names not in `positions` get a made up position that depends only on
+    the name. Exceptions in `failures` are raised, in order, by the first
+    lookups; `delay` is how long, in seconds, each lookup takes.
+    """
+    def __init__(self):
+        self.looked_up = []
+        self.positions = {}
+        self.failures = []
+        self.delay = 0
+
+    def __call__(self, name):
+        self.looked_up.append(name)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.failures:
+            raise self.failures.pop(0)
+        try:
+            return self.positions[name]
+        except KeyError:
+            return SkyCoord(sum(map(ord, name)) % 360, 45, unit='degree')
+
+
+@pytest.fixture
+def clear_lookup_cache(request):
+    # Make sure neither earlier nor later tests see cached positions
+    ph._lookup_object_position.cache_clear()
+    request.addfinalizer(ph._lookup_object_position.cache_clear)
+
+
+@pytest.fixture
+def fake_resolver(monkeypatch, clear_lookup_cache):
+    resolver = FakeResolver()
+    monkeypatch.setattr(ph.SkyCoord, 'from_name', resolver)
+    monkeypatch.setattr(ph, 'sleep', lambda delay: None)
+    return resolver
+
+
 def object_file_with_ra_dec(dir, object_col_name='object',
                             input_objects=None):
     if input_objects is None:
@@ -89,14 +89,13 @@ def add_keys(*files, **kwd):
         key_table = Table.read(key_file, format='ascii')
     else:
         key_table = [(key, value) for key, value in kwd.items()]
+    # The keywords are the same for every file, so build them only once.
+    keywords = [FITSKeyword(name=key, value=val) for key, val in key_table]
     for fil in files:
         logger.info('Adding keys to file %s', fil)
         fil_fits = fits.open(fil, mode='update')
         hdr = fil_fits[0].header
-        for key, val in key_table:
-            keyword = FITSKeyword(name=key, value=val)
-            keyword.add_to_header(hdr, history=True)
-            hdr[key] = val
+        FITSKeyword.add_all_to_header(keywords, hdr, history=True)
         fil_fits.close()
 
 #__doc__ += add_keys.__doc__
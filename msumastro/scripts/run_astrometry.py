@@ -47,8 +47,9 @@ import numpy as np
 from astropy.io import fits
 import astropy.units as u
 from astropy.coordinates import SkyCoord
+from astropy.wcs import WCS
 
-from ccdproc import CCDData, ImageFileCollection
+from ccdproc import ImageFileCollection
 
 from ..customlogger import console_handler, add_file_handlers
 from ..header_processing import astrometry as ast
@@ -119,10 +120,11 @@ def astrometry_for_directory(directories,
                 shutil.copy(src, destination)
 
             original_fname = path.join(working_dir, light_file)
-            img = CCDData.read(original_fname, unit='adu')
+            # Only the pointing is needed here, so skip reading the data.
+            header = fits.getheader(original_fname)
             try:
-                ra = img.header['ra']
-                dec = img.header['dec']
+                ra = header['ra']
+                dec = header['dec']
                 ra_dec = (ra, dec)
             except KeyError:
                 ra_dec = None
@@ -132,8 +134,10 @@ def astrometry_for_directory(directories,
 
             if (ra_dec is None) and (not blind):
                 root, ext = path.splitext(original_fname)
-                f = open(root + '.blind', 'wb')
-                f.close()
+                # Mark the file as needing blind astrometry; the marker is
+                # closed even if something goes wrong creating it.
+                with open(root + '.blind', 'wb'):
+                    pass
                 continue
 
             astrometry = ast.add_astrometry(original_fname,
@@ -150,47 +154,43 @@ def astrometry_for_directory(directories,
                                             solve_field_args=solve_field_args,
                                             timeout=timeout)
 
+            # Open the solved file once to both tidy up the header and, for
+            # blind solves, record the pointing found by astrometry.net.
             with fits.open(original_fname,
                            do_not_scale_image_data=True) as f:
+                header = f[0].header
+                header_changed = False
                 try:
-                    del f[0].header['imageh'], f[0].header['imagew']
-                    f.writeto(original_fname, overwrite=True)
-                except KeyError:
-                    pass
-
-            if astrometry and ra_dec is None:
-                root, ext = path.splitext(original_fname)
-                img_new = CCDData.read(original_fname, unit='adu')
-
-                # The ndmin below ensures center_pix has the right shape
-                # for WCS conversion.
-                center_pix = np.trunc(np.array(img_new.shape, ndmin=2) / 2)
-                print(center_pix[np.newaxis, :].shape)
-                ra_dec = \
-                    img_new.wcs.all_pix2world(center_pix,
-                                              1)
-                ra_dec = ra_dec[0]
-                # RA/Dec are in degrees. Convert them to sexagesimal for
-                # output. Yuck, but makes it easier for existing code to
-                # handle.
-                # Note that FK5 is J2000.
-                coords = SkyCoord(*ra_dec, unit=(u.degree, u.degree),
-                                  frame='fk5')
-
-                img_new.header['RA'] = coords.ra.to_string(unit=u.hour,
-                                                           sep=':')
-                img_new.header['DEC'] = coords.dec.to_string(sep=':')
-
-                # If OBJCTRA/DEC are present then update them
-                try:
-                    img_new.header['objctra']
+                    del header['imageh'], header['imagew']
+                    header_changed = True
                 except KeyError:
                     pass
-                else:
-                    img_new.header['objctra'] = img_new.header['ra']
-                    img_new.header['objctdec'] = img_new.header['dec']
 
-                img_new.write(original_fname, overwrite=True)
+                if astrometry and ra_dec is None:
+                    # The ndmin below ensures center_pix has the right shape
+                    # for WCS conversion.
+                    shape = (header['naxis2'], header['naxis1'])
+                    center_pix = np.trunc(np.array(shape, ndmin=2) / 2)
+                    ra_dec = WCS(header).all_pix2world(center_pix, 1)
+                    ra_dec = ra_dec[0]
+                    # RA/Dec are in degrees. Convert them to sexagesimal for
+                    # output. Yuck, but makes it easier for existing code to
+                    # handle.
+                    # Note that FK5 is J2000.
+                    coords = SkyCoord(*ra_dec, unit=(u.degree, u.degree),
+                                      frame='fk5')
+
+                    header['RA'] = coords.ra.to_string(unit=u.hour, sep=':')
+                    header['DEC'] = coords.dec.to_string(sep=':')
+
+                    # If OBJCTRA/DEC are present then update them
+                    if 'objctra' in header:
+                        header['objctra'] = header['ra']
+                        header['objctdec'] = header['dec']
+                    header_changed = True
+
+                if header_changed:
+                    f.writeto(original_fname, overwrite=True)
 
 
 def construct_parser():
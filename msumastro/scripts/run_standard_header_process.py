@@ -1,12 +1,27 @@
 import os
 import argparse
 import subprocess
+from fnmatch import fnmatch
 
-from ccdproc import ImageFileCollection
+from ccdproc.ccddata import _recognized_fits_file_extensions
 
 from . import script_helpers
 from .run_triage import DefaultFileNames
 
+# ccdproc.ImageFileCollection takes as FITS any file matching '*' plus one
+# of these patterns, i.e. a recognized extension with or without one of the
+# compression suffixes. ccdproc does not expose the compression suffixes,
+# so they are repeated here; test_fits_patterns_match_image_collection
+# checks that the two stay in step.
+FITS_PATTERNS = tuple('*' + ext + compression
+                      for ext in _recognized_fits_file_extensions
+                      for compression in ('', '.gz', '.bz2', '.Z', '.zip',
+                                          '.fz'))
+
+
+def _is_fits_file_name(name):
+    return any(fnmatch(name, pattern) for pattern in FITS_PATTERNS)
+
 
 def construct_parser():
     parser = argparse.ArgumentParser()
@@ -145,9 +160,9 @@ def main(arglist=None):
         # I should probably make sure there are fits files in here.
         # Not going to...
 
-        # Oh fine, I will test.
-        fits_collection = ImageFileCollection(root)
-        if not fits_collection.files:
+        # Oh fine, I will test. os.walk has already listed the directory, so
+        # check the names rather than listing it again in a collection.
+        if not any(_is_fits_file_name(f) for f in files):
             continue
 
         source_rel_to_root = os.path.relpath(root, source_root)
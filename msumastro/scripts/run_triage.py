@@ -40,6 +40,7 @@ EXAMPLES
 """
 
 import os
+import re
 from argparse import ArgumentParser
 import logging
 
@@ -51,6 +52,9 @@ from ..customlogger import console_handler, add_file_handlers
 from ..header_processing.feder import Feder
 from . import script_helpers
 
+# MaxImDL image types look like "Light Frame"
+MAXIMDL_IMAGETYPE = re.compile('[fF]rame')
+
 logger = logging.getLogger()
 screen_handler = console_handler()
 logger.addHandler(screen_handler)
@@ -80,18 +84,13 @@ def contains_maximdl_imagetype(image_collection):
     """
     Check an image file collection for MaxImDL-style image types
     """
-    import re
     file_info = image_collection.summary
 
     if file_info['imagetyp'].mask.any():
         logger.warn('One or more image is missing IMAGETYP in header')
 
-    image_types = ' '.join([typ for typ in file_info['imagetyp'].compressed()])
-
-    if re.search('[fF]rame', image_types) is not None:
-        return True
-    else:
-        return False
+    return any(MAXIMDL_IMAGETYPE.search(typ) is not None
+               for typ in file_info['imagetyp'].compressed())
 
 
 def get_column_name_case_insensitive(name, column_names):
@@ -113,13 +112,68 @@ def get_column_name_case_insensitive(name, column_names):
     str or None
         name of first matching column or ``None``, if no match is found.
     """
+    target = name.lower()
     for cname in column_names:
-        if name.lower() == cname.lower():
+        if target == cname.lower():
             return cname
     else:
         return ''
 
 
+def keyword_is_missing(summary, keyword):
+    """
+    Find the rows of an image summary table which lack a keyword.
+
+    Parameters
+    ----------
+
+    summary : astropy.table.Table
+        Summary table of an image collection.
+
+    keyword : str
+        Name of the keyword.
+
+    Returns
+    -------
+
+    numpy.ndarray of bool
+        ``True`` for each row that has no value for `keyword`.
+    """
+    try:
+        return np.array(summary[keyword].mask, dtype=bool)
+    except KeyError:
+        return np.ones(len(summary), dtype=bool)
+
+
+def fits_keyword_is_missing(summary, fits_keyword):
+    """
+    Find the rows of an image summary table which lack a keyword under all
+    of its names.
+
+    Parameters
+    ----------
+
+    summary : astropy.table.Table
+        Summary table of an image collection.
+
+    fits_keyword : msumastro.header_processing.FITSKeyword
+        Keyword to look for; its name and all synonyms are checked.
+
+    Returns
+    -------
+
+    numpy.ndarray of bool
+        ``True`` for each row that has no value for any name of
+        `fits_keyword`.
+    """
+    masks = [keyword_is_missing(summary, name) for name in summary.colnames
+             if fits_keyword.matches(name)]
+    if not masks:
+        # No column for any name of the keyword, so every row is missing it
+        return np.ones(len(summary), dtype=bool)
+    return np.array(masks, dtype=bool).all(axis=0)
+
+
 def triage_fits_files(dir=None, file_info_to_keep=None):
     """
     Check FITS files in a directory for deficient headers
@@ -138,6 +192,14 @@ def triage_fits_files(dir=None, file_info_to_keep=None):
        (all_file_info != '*')):
         all_file_info.extend(RA.names)
 
+    if all_file_info != '*':
+        # The lists below are built from these columns of the summary, so
+        # they must be in it even if the caller did not ask for them.
+        have_keys = set(key.lower() for key in all_file_info)
+        all_file_info.extend(key for key in ['imagetyp', 'object',
+                                             'filter', 'wcsaxes']
+                             if key not in have_keys)
+
     images = ImageFileCollection(dir, keywords=all_file_info)
     file_info = images.summary
 
@@ -146,37 +208,30 @@ def triage_fits_files(dir=None, file_info_to_keep=None):
         raise ValueError(
             'Correct MaxImDL-style image types before proceeding.')
 
-    file_needs_filter = \
-        list(images.files_filtered(imagetyp='light',
-                                   filter=None))
-    file_needs_filter += \
-        list(images.files_filtered(imagetyp='flat',
-                                   filter=None))
+    # Build the selections once from the summary table instead of
+    # filtering the collection again for each list. Like files_filtered,
+    # these image type matches ignore case.
+    files = np.asarray(file_info['file'])
+    image_types = np.asarray(file_info['imagetyp'].filled(''), dtype=str)
+    upper_image_types = np.char.upper(image_types)
+    is_light = upper_image_types == 'LIGHT'
+    is_flat = upper_image_types == 'FLAT'
+    no_filter = keyword_is_missing(file_info, 'filter')
+
+    file_needs_filter = list(files[is_light & no_filter])
+    file_needs_filter += list(files[is_flat & no_filter])
 
     file_needs_object_name = \
-        list(images.files_filtered(imagetyp='light',
-                                   object=None))
+        list(files[is_light & keyword_is_missing(file_info, 'object')])
 
-    lights = file_info[file_info['imagetyp'] == 'LIGHT']
+    # Pointing and astrometry have always been checked only for files
+    # whose image type is exactly LIGHT.
+    lights = file_info[image_types == 'LIGHT']
     file_needs_pointing = []
     file_needs_astrometry = []
     if lights:
-        has_no_ra = np.array([True] * len(lights))
-        has_no_ha = np.array([True] * len(lights))
-        for ra_name in RA.names:
-            col_name = \
-                get_column_name_case_insensitive(ra_name, lights.colnames)
-            try:
-                has_no_ra &= (lights[col_name].mask)
-            except KeyError:
-                pass
-        for ha_name in feder.HA.names:
-            col_name = \
-                get_column_name_case_insensitive(ha_name, lights.colnames)
-            try:
-                has_no_ha &= lights[col_name].mask
-            except KeyError:
-                pass
+        has_no_ra = fits_keyword_is_missing(lights, RA)
+        has_no_ha = fits_keyword_is_missing(lights, feder.HA)
 
         file_needs_astrometry = list(lights['file'][lights['wcsaxes'].mask])
         needs_minimal_pointing = has_no_ha | has_no_ra
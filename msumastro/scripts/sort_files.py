@@ -65,6 +65,9 @@ EXAMPLES
 import os
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from ccdproc import ImageFileCollection
 
 from ..customlogger import console_handler, add_file_handlers
@@ -78,7 +81,7 @@ screen_handler = console_handler()
 logger.addHandler(screen_handler)
 
 
-def copy_files(files, dest, copy_or_move):
+def copy_files(files, dest, copy_or_move, max_workers=8):
     """
     Copy a list of files to a directory
 
@@ -88,9 +91,17 @@ def copy_files(files, dest, copy_or_move):
         List of paths of files to be copied
     dest : str
         Name of dirctory to which files should be copied
+    copy_or_move : function
+        Function, called as ``copy_or_move(file, dest)``, which does the
+        copying (or moving).
+    max_workers : int, optional
+        Number of files to copy at the same time. Copying is limited by disk
+        I/O rather than by python, so several copies can be in progress at
+        once.
     """
-    for f in files:
-        copy_or_move(f, dest)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list forces any exception raised while copying to be re-raised here
+        list(executor.map(lambda f: copy_or_move(f, dest), files))
 
 
 def sort_directory(directory, verbose=False,
@@ -150,8 +161,10 @@ def sort_directory(directory, verbose=False,
                    flat: ['filter', 'exptime'],
                    light: ['object', 'filter', 'exptime']}
     table_by_type = full_table.group_by('imagetyp')
-    prepend_path = lambda path, file_list: \
-                        [os.path.join(path, f) for f in file_list]
+    # Every file is in the same directory, so join the directory once and
+    # just concatenate file names onto it.
+    source_prefix = os.path.join(directory, '')
+    prepend_path = lambda file_list: [source_prefix + f for f in file_list]
     for im_type, table in zip(table_by_type.groups.keys,
                               table_by_type.groups):
         image_type = im_type['imagetyp']
@@ -159,15 +172,15 @@ def sort_directory(directory, verbose=False,
         dest_dir = os.path.join(working_dir, image_type)
         if not tree_keys:
             # bias
-            source_files = prepend_path(directory, table['file'])
+            source_files = prepend_path(table['file'])
             this_dest = os.makedirs(dest_dir)
             copy_files(source_files, dest_dir, copy_or_move)
             continue
-        mask = [False] * len(table)
+        mask = np.zeros(len(table), dtype=bool)
         for key in tree_keys:
             mask |= table[key].mask
-        if any(mask):
-            source_files = prepend_path(directory, table['file'][mask])
+        if mask.any():
+            source_files = prepend_path(table['file'][mask])
             this_dest = os.path.join(dest_dir, UNSORTED_DIR)
             os.makedirs(this_dest)
             copy_files(source_files, this_dest, copy_or_move)
@@ -181,7 +194,7 @@ def sort_directory(directory, verbose=False,
                 str_parents = [str(p) for p in parents]
                 this_dest = os.path.join(dest_dir, *str_parents)
                 os.makedirs(this_dest)
-                source_files = prepend_path(directory, files)
+                source_files = prepend_path(files)
                 copy_files(source_files, this_dest, copy_or_move)
 
 
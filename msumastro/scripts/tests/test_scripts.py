@@ -1,7 +1,10 @@
 import os
 from contextlib import contextmanager
+from types import SimpleNamespace
 
 import astropy.io.fits as fits
+import astropy.units as u
+from astropy.coordinates import SkyCoord
 from astropy.table import Table, Column
 from ccdproc import ImageFileCollection
 
@@ -10,6 +13,7 @@ import py
 import numpy as np
 
 from ...header_processing.patchers import IRAF_image_type
+from ...header_processing.fitskeyword import FITSKeyword
 from .. import run_patch as run_patch
 
 from .. import run_triage
@@ -226,6 +230,32 @@ class TestScript(object):
         with pytest.raises(ValueError):
             run_triage.triage_fits_files(self.test_dir.strpath)
 
+    def test_triage_lists_do_not_depend_on_keywords_kept(self):
+        lists = ['needs_filter', 'needs_object_name', 'needs_pointing',
+                 'needs_astrometry']
+        default = run_triage.triage_fits_files(self.test_dir.strpath)
+        only_type = run_triage.triage_fits_files(self.test_dir.strpath,
+                                                 file_info_to_keep=['exptime'])
+        for key in lists:
+            assert sorted(only_type[key]) == sorted(default[key])
+
+    def test_triage_image_type_case(self):
+        ic = ImageFileCollection(self.test_dir.strpath,
+                                 keywords=['imagetyp'])
+        lower_case_light = ic.files_filtered(imagetyp='light')[0]
+        with fits.open(self.test_dir.join(lower_case_light).strpath,
+                       mode='update') as hdulist:
+            header = hdulist[0].header
+            for key in ['filter', 'object']:
+                header.remove(key, ignore_missing=True)
+            header['imagetyp'] = 'light'
+        result = run_triage.triage_fits_files(self.test_dir.strpath)
+        # The filter and object checks ignore case, as files_filtered does,
+        # but pointing is only checked for an image type of exactly LIGHT.
+        assert lower_case_light in result['needs_filter']
+        assert lower_case_light in result['needs_object_name']
+        assert lower_case_light not in result['needs_pointing']
+
     def test_run_triage_contains_columns_with_extended_location_info(self):
         result = run_triage.triage_fits_files(self.test_dir.strpath)
         location_keys = ['Source path', 'Source directory']
@@ -290,6 +320,28 @@ class TestScript(object):
         assert (run_triage.get_column_name_case_insensitive('two', columns)
                 == 'Two')
 
+    def test_triage_keyword_is_missing(self):
+        summary = Table([['a', 'b', 'c'], ['R', '', 'V']],
+                        names=['file', 'filter'], masked=True)
+        summary['filter'].mask = [False, True, False]
+        assert (run_triage.keyword_is_missing(summary, 'filter') ==
+                [False, True, False]).all()
+        assert run_triage.keyword_is_missing(summary, 'object').all()
+
+    def test_triage_fits_keyword_is_missing(self):
+        ra = FITSKeyword('ra', synonyms=['objctra'])
+        summary = Table([['a', 'b', 'c'], ['1', '', ''], ['', '2', '']],
+                        names=['file', 'RA', 'objctra'], masked=True)
+        summary['RA'].mask = [False, True, True]
+        summary['objctra'].mask = [True, False, True]
+        assert (run_triage.fits_keyword_is_missing(summary, ra) ==
+                [False, False, True]).all()
+        no_ra = Table([['a', 'b']], names=['file'], masked=True)
+        assert run_triage.fits_keyword_is_missing(no_ra, ra).all()
+        for empty in [summary[:0], no_ra[:0]]:
+            missing = run_triage.fits_keyword_is_missing(empty, ra)
+            assert missing.shape == (0,)
+
     def test_run_astrometry_with_dest_does_not_modify_source(self):
 
         destination = self.test_dir.make_numbered_dir()
@@ -445,6 +497,71 @@ class TestRunStandardHeaderProcess(object):
             assert(original == new)
 
 
+def test_fits_patterns_match_image_collection(tmpdir):
+    names = ['a' + ext + compression
+             for ext in ['.fit', '.fits', '.fts', '.FIT', '.Fits', '.fitz',
+                         '.txt', 'fit']
+             for compression in ['', '.gz', '.bz2', '.Z', '.zip', '.fz',
+                                 '.GZ', '.xz']]
+    for name in names:
+        tmpdir.join(name).write('')
+    # Ask ccdproc which of these it treats as FITS without having it read
+    # the (empty) files.
+    collection = SimpleNamespace(location=tmpdir.strpath,
+                                 _find_fits_by_reading=False)
+    ccdproc_names = ImageFileCollection._fits_files_in_directory(collection)
+    our_names = [name for name in names
+                 if run_standard_header_process._is_fits_file_name(name)]
+    assert sorted(our_names) == sorted(ccdproc_names)
+
+
+def test_run_astrometry_blind_solve_updates_pointing(tmpdir, monkeypatch):
+    data = np.arange(400, dtype=np.uint16).reshape(20, 20)
+    hdu = fits.PrimaryHDU(data)
+    hdu.header['imagetyp'] = 'LIGHT'
+    hdu.header['objctra'] = '00 00 00'
+    hdu.header['objctdec'] = '+00 00 00'
+    light = tmpdir.join('light.fit')
+    hdu.writeto(light.strpath)
+    with fits.open(light.strpath, do_not_scale_image_data=True) as f:
+        raw_before = f[0].data.copy()
+
+    # Put the center pixel used by run_astrometry at the reference pixel.
+    crval = (210.8025, 54.3487)
+
+    def fake_add_astrometry(filename, **kwd):
+        assert kwd['ra_dec'] is None
+        with fits.open(filename, mode='update') as f:
+            hdr = f[0].header
+            hdr['ctype1'] = 'RA---TAN'
+            hdr['ctype2'] = 'DEC--TAN'
+            hdr['crpix1'], hdr['crpix2'] = 10, 10
+            hdr['crval1'], hdr['crval2'] = crval
+            hdr['cd1_1'], hdr['cd1_2'] = -1.5e-4, 0
+            hdr['cd2_1'], hdr['cd2_2'] = 0, 1.5e-4
+            hdr['imagew'], hdr['imageh'] = 20, 20
+        return True
+
+    monkeypatch.setattr(run_astrometry.ast, 'add_astrometry',
+                        fake_add_astrometry)
+    run_astrometry.astrometry_for_directory([tmpdir.strpath], blind=True)
+
+    expected = SkyCoord(*crval, unit=(u.degree, u.degree), frame='fk5')
+    expected_ra = expected.ra.to_string(unit=u.hour, sep=':')
+    expected_dec = expected.dec.to_string(sep=':')
+    with fits.open(light.strpath, do_not_scale_image_data=True) as f:
+        hdr = f[0].header
+        assert hdr['ra'] == expected_ra
+        assert hdr['dec'] == expected_dec
+        assert hdr['objctra'] == expected_ra
+        assert hdr['objctdec'] == expected_dec
+        assert 'imagew' not in hdr
+        assert 'imageh' not in hdr
+        assert hdr['bzero'] == 32768
+        assert f[0].data.dtype == raw_before.dtype
+        np.testing.assert_array_equal(f[0].data, raw_before)
+
+
 class TestSortFiles(object):
     """docstring for TestSortFiles"""
     @pytest.fixture(autouse=True)
@@ -204,3 +204,9 @@ def test_grouper_walk(testing_table, expected_tree):
         grouping_keys = grouping_string.split(',')
         grouper = tt.TableTree(testing_table, grouping_keys, index_with)
         validate_walk(grouper, good_tree)
+
+
+def test_table_tree_is_available_from_package():
+    import msumastro
+    assert msumastro.TableTree is tt.TableTree
+    assert dir(msumastro).count('TableTree') == 1